@@ -1,12 +1,43 @@
 """Podlet - A type-safe dependency injection framework for Python."""
 
-from .bootstrap import Bootstrap
-from .helpers import Resolve, only_while_initializing
-from .registrant import RegistrantAbstract
-from .registrar import Registrar
-from .registry import Registry
-from .resource import ResourceAbstract, ResourceRegistry
-from .types import RegistrantIdentity, RegistrantKind, Tr
+from __future__ import annotations
+
+import importlib
+
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from .bootstrap import Bootstrap
+    from .helpers import Resolve, only_while_initializing
+    from .registrant import RegistrantAbstract
+    from .registrar import Registrar
+    from .registry import Registry
+    from .resource import ResourceAbstract, ResourceRegistry
+    from .types import RegistrantIdentity, RegistrantKind, Tr
+
+
+# Exported name -> submodule, loaded on first attribute access (PEP 562)
+_LAZY = {
+    # Types
+    "RegistrantKind":          ".types",
+    "RegistrantIdentity":      ".types",
+    "Tr":                      ".types",
+    
+    # Helpers
+    "only_while_initializing": ".helpers",
+    "Resolve":                 ".helpers",
+    
+    # Core classes
+    "RegistrantAbstract":      ".registrant",
+    "Registry":                ".registry",
+    "Registrar":               ".registrar",
+    
+    # Resource-specific classes
+    "ResourceAbstract":        ".resource",
+    "ResourceRegistry":        ".resource",
+    "Bootstrap":               ".bootstrap",
+}
 
 
 __all__ = [
@@ -30,5 +61,20 @@ __all__ = [
     "Bootstrap",
 ]
 
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    # Cache on the module so __getattr__ only runs once per name
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
 def main() -> None:
     print("Hello from podlet!")
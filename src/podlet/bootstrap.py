@@ -1,7 +1,7 @@
 from dataclasses import dataclass
-from typing import List, Type, TypeVar, Union, cast
+from typing import Any, Dict, List, Optional, Type, TypeVar, Union, cast
 
-from .helpers import Resolve
+from .helpers import resolve_identity
 from .registrar import Registrar
 from .resource import ResourceAbstract, ResourceRegistry
 
@@ -30,16 +30,15 @@ class Bootstrap(Registrar):
     """
 
 
-    def __init__(self, *, resources : List[Type[ResourceRegistrantT]] = [], options = {}, ) -> None:
-        super().__init__({}, options)
+    def __init__(self, *, resources : Optional[List[Type[ResourceRegistrantT]]] = None, options : Optional[Dict[str, Any]] = None, ) -> None:
+        super().__init__({}, options if options is not None else {})
         
         # Register Typed Registries
         self.register_registry(ResourceRegistry) # Resource
                 
         # Register provided resources
-        registry = self.get_registry(ResourceAbstract)
-        for resource in resources:
-            registry.register(resource)
+        if resources:
+            self.get_registry(ResourceAbstract).bulk_register(resources)
 
     def resources(self) -> ResourceRegistry:
         """Get the resource registry."""
@@ -49,9 +48,9 @@ class Bootstrap(Registrar):
     
     def get_resource(self, ident_or_type: Union[str, Type[ResourceRegistrantT]]) -> ResourceRegistrantT:
         """Get a resource by ident or type ensuring the correct type is returned."""
-        resolve = Resolve(ident_or_type)
-        resource = self.get(ResourceAbstract.kind(), resolve.identity)
+        identity = resolve_identity(ident_or_type)
+        resource = self.get(ResourceAbstract.kind(), identity)
         expected_type = ident_or_type if isinstance(ident_or_type, type) else ResourceAbstract
         if not isinstance(resource, expected_type):
-            raise TypeError(f"Ident('{resolve.identity}') is not an instance of {expected_type.__name__}")
+            raise TypeError(f"Ident('{identity}') is not an instance of {expected_type.__name__}")
         return cast(ResourceRegistrantT, resource)
@@ -3,51 +3,100 @@
 from __future__ import annotations
 
 import re
+import sys
+
+from functools import wraps
 
-from dataclasses import dataclass
 from typing import Any
 
+from .registrant import RegistrantAbstract
 from .types import RegistrantIdentity, RegistrantKind
 
 
+_SNAKE_CASE_ACRONYM = re.compile(r"([A-Z]+)([A-Z][a-z])")
+_SNAKE_CASE_WORD    = re.compile(r"([a-z\d])([A-Z])")
+
+
 def snake_case(word: str) -> str:
     """Convert a given string to snake_case.
     
     Credit: `inflection` package
     """
-    word = re.sub(r"([A-Z]+)([A-Z][a-z])", r'\1_\2', word)
-    word = re.sub(r"([a-z\d])([A-Z])", r'\1_\2', word)
+    word = _SNAKE_CASE_ACRONYM.sub(r'\1_\2', word)
+    word = _SNAKE_CASE_WORD.sub(r'\1_\2', word)
     word = word.replace("-", "_")
     return word.lower()
 
 
 def only_while_initializing(func):
     """Decorator to ensure that a method of a registrant is only called while initializing."""
+    @wraps(func)
     def wrapper(self, *args, **kwargs):
-        # Import here to avoid circular imports
-        from .registrant import RegistrantAbstract
-        from .resource import wraps
-        
-        if not isinstance(self, RegistrantAbstract):
-            raise TypeError(f"Decorator only_while_initializing(): The {self.__class__.__name__} does not inherit from RegistrantAbstract, which is a requirement of this decorator.")
-        if not self._is_initializing:
+        # Only diagnose on the failure path; registrants always carry the slot, other objects default to False
+        if not getattr(self, "_is_initializing", False):
+            if not isinstance(self, RegistrantAbstract):
+                raise TypeError(f"Decorator only_while_initializing(): The {self.__class__.__name__} does not inherit from RegistrantAbstract, which is a requirement of this decorator.")
             raise RuntimeError(f"Contract violation attempted detected: {self!r}.{func.__name__}() can not be called outside of initialization.")
         return func(self, *args, **kwargs)
     return wrapper
 
 
-@dataclass(init=False)
+def _resolve_cached(unknown: Any) -> tuple[str | None, str | None]:
+    """Read the (kind, identity) memoized on the class itself; either is None when it can only be answered by the classmethods."""
+    klass = unknown if isinstance(unknown, type) else type(unknown)
+    # Read from the class's own __dict__, so a subclass never answers with a value memoized on its parent
+    namespace = klass.__dict__
+    if issubclass(klass, RegistrantAbstract):
+        return (namespace.get("_kind_cache"), namespace.get("_identity_cache"))
+    if issubclass(klass, _registry.Registry):
+        return (namespace.get("_kind"), None)
+    return (None, None)
+
+
+def resolve_kind(unknown: Any) -> RegistrantKind:
+    """Resolve the kind of a str, registrant or registry (class or instance) without allocating a Resolve."""
+    if type(unknown) is str: return sys.intern(unknown)
+    if (kind := _resolve_cached(unknown)[0]) is not None: return kind
+    return Resolve(unknown).kind
+
+
+def resolve_identity(unknown: Any) -> RegistrantIdentity:
+    """Resolve the identity of a str or registrant (class or instance) without allocating a Resolve."""
+    if type(unknown) is str: return sys.intern(unknown)
+    if (identity := _resolve_cached(unknown)[1]) is not None: return identity
+    return Resolve(unknown).identity
+
+
 class Resolve:
+    __slots__ = ("unknown", "_kind", "_identity")
+    
     unknown: Any
     
     def __init__(self, unknown: Any) -> None:
         self.unknown = unknown
+        
+        # Dispatch once on the exact type; kind and identity are then plain attribute reads
+        if type(unknown) is str:
+            self._kind = self._identity = sys.intern(unknown)
+            return
+        if isinstance(unknown, str):
+            self._kind = self._identity = sys.intern(str(unknown))
+            return
+        
+        self._kind, self._identity = _resolve_cached(unknown)
+    
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(unknown={self.unknown!r})"
+    
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.unknown == other.unknown
+    
+    __hash__ = None # type: ignore[assignment]
     
     @property
     def is_registrant(self) -> bool:
-        # Import here to avoid circular imports
-        from .registrant import RegistrantAbstract
-        
         if isinstance(self.unknown, RegistrantAbstract): return True
         if isinstance(self.unknown, type) and issubclass(self.unknown, RegistrantAbstract): return True
         return False
@@ -59,23 +108,25 @@ class Resolve:
     
     @property
     def is_registry(self) -> bool:
-        # Import here to avoid circular imports
-        from .registry import Registry
-        
-        if isinstance(self.unknown, Registry): return True
-        if isinstance(self.unknown, type) and issubclass(self.unknown, Registry): return True
+        if isinstance(self.unknown, _registry.Registry): return True
+        if isinstance(self.unknown, type) and issubclass(self.unknown, _registry.Registry): return True
         return False
     
     
     @property
     def kind(self) -> str:
-        if self.is_str: return str(self.unknown)
-        if self.is_registrant: return self.unknown.kind()
+        if self._kind is not None: return self._kind
+        if self.is_registrant: return self.unknown._cached_kind()
         if self.is_registry: return self.unknown.kind()
         raise TypeError(f"Cannot resolve kind from {self.unknown!r}")    
     
     @property
     def identity(self) -> str:
-        if self.is_str: return str(self.unknown)
-        if self.is_registrant: return self.unknown.identity()
+        if self._identity is not None: return self._identity
+        if self.is_registrant: return self.unknown._cached_identity()
         raise TypeError(f"Cannot resolve identity from {self.unknown!r}")
+
+
+# Bound last to avoid circular imports: `registry` imports `Resolve` from this module, so only the
+# module object is bound here (safe even while it is partially initialized) and `Registry` is read from it on use.
+from . import registry as _registry  # noqa: E402
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import sys
+
 from abc import ABC, abstractmethod
-from contextlib import contextmanager
-from typing import TYPE_CHECKING, Any, Dict, Generator
+from collections.abc import Mapping
+from functools import wraps
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Optional, Self
 
 from .types import RegistrantIdentity, RegistrantKind
 
@@ -13,7 +16,53 @@ if TYPE_CHECKING:
     from .registry import Registry
 
 class RegistrantAbstract(ABC):
-    """Base class for all registrants within the Bootstrap DI system."""
+    """Base class for all registrants within the Bootstrap DI system.
+    
+    Declares `__slots__`; subclasses that declare their own `__slots__` carry no per-instance `__dict__`.
+    """
+
+    __slots__ = ("registry", "_is_initializing", "_is_initialized")
+
+    # Memoized results of kind() and identity(), filled per subclass on first resolution (see `_cached_kind()`)
+    _kind_cache:     ClassVar[Optional[RegistrantKind]]     = None
+    _identity_cache: ClassVar[Optional[RegistrantIdentity]] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        
+        # Guard this subclass's own initialize() so it becomes a noop once the instance is initialized.
+        if callable(initialize := cls.__dict__.get("initialize")):
+            cls.initialize = cls._guard_initialize(initialize)
+
+    @staticmethod
+    def _guard_initialize(initialize: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(initialize) # also carries over __isabstractmethod__
+        def guarded(self: RegistrantAbstract, *args: Any, **kwargs: Any) -> Any:
+            if self._is_initialized:
+                return None
+            return initialize(self, *args, **kwargs)
+        return guarded
+
+    @classmethod
+    def _cached_kind(cls) -> RegistrantKind:
+        """kind(), memoized on this subclass the first time it is resolved (so after any class decorators have run)."""
+        if (kind := cls.__dict__.get("_kind_cache")) is not None:
+            return kind
+        kind = cls.kind()
+        # Only exact str values are interned and cached; anything else (e.g. a StrEnum) is asked again next time
+        if type(kind) is str:
+            kind = cls._kind_cache = sys.intern(kind)
+        return kind
+
+    @classmethod
+    def _cached_identity(cls) -> RegistrantIdentity:
+        """identity(), memoized on this subclass the first time it is resolved (so after any class decorators have run)."""
+        if (identity := cls.__dict__.get("_identity_cache")) is not None:
+            return identity
+        identity = cls.identity()
+        if type(identity) is str:
+            identity = cls._identity_cache = sys.intern(identity)
+        return identity
 
     # == Class Methods =========================================================
 
@@ -38,11 +87,11 @@ class RegistrantAbstract(ABC):
 
     @abstractmethod
     def initialize(self) -> None:
-        """Runs once and is then completely deleted from the instance via the __init__ method to guarantee that contract is enforced."""
+        """Runs once via the __init__ method; any later call is a noop (see `_guard_initialize()`) to guarantee that contract is enforced."""
         pass
     
     @property
-    def options(self) -> Dict[str, Any]:
+    def options(self) -> Mapping[str, Any]:
         """Get the options for this registrant instance."""
         if self.registry is None:
             return {}
@@ -51,40 +100,38 @@ class RegistrantAbstract(ABC):
         
     # == Protected Methods and Properties ==================================
     
+    def __new__(cls, *args: Any, **kwargs: Any) -> Self:
+        # Default the state slots before __init__ runs, as slots can't carry class-level defaults
+        instance = super().__new__(cls)
+        instance._is_initialized = False
+        instance._is_initializing = False
+        return instance
+    
     def __init__(self, registry: Registry) -> None:
         """PRIVATE: Do not call this directly, use the abstract `initialize()` method instead."""
         self.registry = registry
         
-        with self._initialization_context():
-            # Initialize this instance
-            self.initialize()
-
-        # Overwrite initialize method to make it a noop instead of deleting it
-        # This ensures the contract is enforced.
-        self.initialize = lambda *args, **kwargs: None
-
-    @contextmanager
-    def _initialization_context(self) -> Generator[None, None, None]:
-        """Context manager to handle both the initialization state and the enforcement of that contract."""
-        if self.is_initialized:
+        # Enforce the initialization contract
+        if self._is_initialized:
             raise RuntimeError(f"{self!r} is already initialized.")
-        if self.is_initializing:
+        if self._is_initializing:
             raise RuntimeError(f"{self!r} is already initializing.")
         
         self._is_initializing = True # start 
         try:
-            yield 
+            # Initialize this instance
+            self.initialize()
         finally:
             self._is_initializing = False
             self._is_initialized = True
 
     @property
     def is_initialized(self) -> bool: 
-        return hasattr(self, "_is_initialized") and self._is_initialized
+        return self._is_initialized
 
     @property
     def is_initializing(self) -> bool: 
-        return hasattr(self, "_is_initializing") and self._is_initializing
+        return self._is_initializing
     
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(kind={self.kind()!r}, identity={self.identity()!r})"
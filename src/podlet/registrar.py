@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional, Self, Type, TypeVar, cast, overload
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Self, Type, TypeVar, cast, overload
 
-from .helpers import Resolve
-from .registry import Registry
+from .helpers import resolve_identity, resolve_kind
+from .registry import _EMPTY_OPTIONS, Registry
 from .types import RegistrantIdentity, RegistrantKind, Tr
 
 
+_MISSING = object()
+
+
 @dataclass
 class Registrar:
     """Registrar manages registries that themselves manage a specific _kind_ (not type) of RegistrantAbstract.
@@ -38,15 +43,33 @@ class Registrar:
     
     def get_registry_options(self, kind_or_type: str | Type[Any]) -> Dict[str, Any]:
         """Get the options for a specific registry by its kind or type."""
-        kind = Resolve(kind_or_type).kind
-        if kind in self.options:
-            return cast(Dict[str, Any], self.options[kind])
-        return {}
+        options = self.options.get(resolve_kind(kind_or_type), _MISSING)
+        if options is _MISSING:
+            return {}
+        return cast(Dict[str, Any], options)
     
     def set_registry_options(self, kind_or_type: str | Type[Any], options: Dict[str, Any]) -> None:
         """Set the options for a specific registry by its kind or type."""
-        kind = Resolve(kind_or_type).kind
+        kind = resolve_kind(kind_or_type)
         self.options[kind] = options
+    
+    def get_registrant_options(self, kind_or_type: str | Type[Any], ident_or_type: str | Type[Any]) -> Mapping[str, Any]:
+        """Get the read-only options for a specific registrant by its registry's kind or type and its identity or type.
+        
+        Always read from the current `options`, so it agrees with get_registry_options() however they were changed.
+        """
+        kind = resolve_kind(kind_or_type)
+        registrants = self.options.get(kind, _MISSING)
+        if not isinstance(registrants, Mapping):
+            return _EMPTY_OPTIONS
+        
+        identity = resolve_identity(ident_or_type)
+        options = registrants.get(identity, _MISSING)
+        if options is _MISSING:
+            return _EMPTY_OPTIONS
+        if not isinstance(options, Mapping):
+            return options
+        return MappingProxyType(options)
 
     def set_options(self, options: Dict[str, Any]) -> None:
         """Set the options for the entire registrar.
@@ -68,7 +91,7 @@ class Registrar:
     def has_registry(self, kind_or_type: Type[Any]) -> bool: ...
 
     def has_registry(self, kind_or_type: str | Type[Any]) -> bool:
-        return Resolve(kind_or_type).kind in self.registries
+        return resolve_kind(kind_or_type) in self.registries
 
     @overload
     def get_registry(self, kind_or_type: str) -> Registry[Any]: ...
@@ -77,44 +100,41 @@ class Registrar:
 
     def get_registry(self, kind_or_type: str | Type[Tr]) -> Registry[Tr] | Registry[Any]:
         """Get a Registry instance for a specific kind of registrant."""
-        kind = Resolve(kind_or_type).kind
-        if kind not in self.registries:
+        kind = resolve_kind(kind_or_type)
+        if (registry := self.registries.get(kind)) is None:
             raise KeyError(f"No registry found for kind '{kind}'")
-        registry = self.registries[kind]
-        
-        if not isinstance(registry, str):
-            registry = cast(Registry[Tr], registry)
-        
-        return registry
+        return cast(Registry[Tr], registry)
      
     def register_registry(self, registry_klass: Type[Registry[Any]]) -> None:
         """Register a typed Registry class with this registrar."""
         if not issubclass(registry_klass, Registry):
             raise TypeError(f"Cannot register {registry_klass}: must be a subclass of Registry")
 
-        kind = Resolve(registry_klass).kind
+        kind = resolve_kind(registry_klass)
         if kind != registry_klass.kind():
              raise ValueError(f"Cannot register {registry_klass.__name__}: its kind ('{kind}') does not match the registry's kind ('{registry_klass.kind()}')")
 
-        if kind not in self.registries:
-            self.registries[kind] = registry_klass(registrar=self)
+        if (registry := self.registries.get(kind)) is None:
+            registry = self.registries[kind] = registry_klass(registrar=self)
             
-        return self.registries[kind]
+        return registry
 
     
     
     def register(self, *klasses: Type[Any]) -> None:
         """Register multiple RegistrantAbstract classes with a Registry that has been setup via register_registry()."""
+        # Bucket by kind so each registry is looked up once
+        buckets: Dict[str, List[Type[Any]]] = {}
         for klass in klasses:
-            kind = Resolve(klass).kind
+            buckets.setdefault(resolve_kind(klass), []).append(klass)
 
-            # Initialize Registry (if needed)
-            if not self.has_registry(kind):
-                raise ValueError(f"Cannot register {klass.__name__}: as no registry exists for kind '{kind}' -- use register_registry() ensure it's ready to accept RegistrantAbstracts of this kind.")
+        for kind, bucket in buckets.items():
+            # Ensure the Registry exists
+            if (registry := self.registries.get(kind)) is None:
+                raise ValueError(f"Cannot register {bucket[0].__name__}: as no registry exists for kind '{kind}' -- use register_registry() ensure it's ready to accept RegistrantAbstracts of this kind.")
 
-            # Get the registry and register the class
-            registry = self.get_registry(kind)
-            registry.register(klass)
+            # Register the classes
+            registry.bulk_register(bucket)
         
         
         
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import sys
+
+from collections.abc import Mapping
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Dict, Generic, Optional, Self, Type, TypeVar, cast, get_args, get_origin
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, Generic, Iterable, Optional, Self, Type, TypeVar, cast, get_args, get_origin
 
-from .helpers import Resolve
+from .helpers import resolve_identity, resolve_kind
 from .types import RegistrantKind, Tr
 
 
@@ -14,7 +18,10 @@ if TYPE_CHECKING:
     from .registrar import Registrar
 
 
-@dataclass(init=False)
+_EMPTY_OPTIONS: Mapping[str, Any] = MappingProxyType({})
+
+
+@dataclass(init=False, slots=True, weakref_slot=True)
 class Registry(Generic[Tr]):
     """A registry specifically for a RegistrantKind of RegistrantAbstract."""
     
@@ -24,15 +31,33 @@ class Registry(Generic[Tr]):
 
     registrar:   Optional[Registrar]   
 
+    # Computed once per subclass by __init_subclass__(), None when it can't be inferred
+    _registrant_cls: ClassVar[Optional[Type[Any]]]      = None
+    _kind:           ClassVar[Optional[RegistrantKind]] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        # Explicit super(): dataclass(slots=True) recreates the class, so the zero-argument form would bind to the original
+        super(Registry, cls).__init_subclass__(**kwargs)
+        
+        try:
+            cls._registrant_cls = cls._infer_registrant_type()
+        except TypeError:
+            cls._registrant_cls = None
+        
+        try:
+            kind = cls.kind()
+        except (TypeError, AttributeError, NotImplementedError):
+            kind = None
+        cls._kind = sys.intern(kind) if type(kind) is str else None
             
     @classmethod
     def kind(cls) -> RegistrantKind:
         """Inferred kind of the registry."""
         if not issubclass(cls, Registry): raise TypeError("Can't be called from a non-subclass of Registry.")
         
-        # Memoize for this subclass
-        if not hasattr(cls, "_kind"): setattr(cls, "_kind", cls._registrant_type().kind())
-        return getattr(cls, "_kind")
+        # Memoized for this subclass by __init_subclass__()
+        if (kind := cls.__dict__.get("_kind")) is not None: return kind
+        return cls._registrant_type().kind()
             
     def __init__(self, registrar: Optional[Any] = None) -> None:
         self.registrar = registrar
@@ -44,82 +69,110 @@ class Registry(Generic[Tr]):
     # == Helpers ==========================================================
     
     def has_registered(self, ident_or_type: str | Type[Tr]) -> bool:
-        return Resolve(ident_or_type).identity in self.registered.keys()
+        return resolve_identity(ident_or_type) in self.registered
 
     
     def has_initialized(self, ident_or_type: str | Type[Tr]) -> bool:
-        return Resolve(ident_or_type).identity in self.initialized.keys()
+        return resolve_identity(ident_or_type) in self.initialized
     
     
     def get_registered(self, ident_or_type: str | Type[Tr]) -> Type[Tr]:
-        if self.has_registered(ident_or_type):
-            klass = self.registered[Resolve(ident_or_type).identity]
-            return cast(Type[Tr], klass)
-        
-        raise ValueError(f"Registrant '{ident_or_type!r}' is not registered.")
+        klass = self.registered.get(resolve_identity(ident_or_type))
+        if klass is None:
+            raise ValueError(f"Registrant '{ident_or_type!r}' is not registered.")
+        return cast(Type[Tr], klass)
     
     def get_initialized(self, ident_or_type: str | Type[Tr]) -> Tr:
-        if self.has_initialized(ident_or_type):
-            return self.initialized[Resolve(ident_or_type).identity]
-        raise ValueError(f"Registrant '{ident_or_type!r}' is not initialized.")
+        instance = self.initialized.get(resolve_identity(ident_or_type))
+        if instance is None:
+            raise ValueError(f"Registrant '{ident_or_type!r}' is not initialized.")
+        return instance
     
     def is_compatible(self, klass: Type) -> bool:
         """Check if the given class is compatible with this registry's registrant_type."""
-        minimum_type = self._registrant_type()
-        return (klass is minimum_type or issubclass(klass, minimum_type))
+        return issubclass(klass, self._registrant_cls or self._registrant_type())
     
-    def get_registrant_options(self, ident_or_type: str | Type[Tr]) -> Any:
-        """Get options for a registrant by ident or type."""
-        return self.get_options().get(Resolve(ident_or_type).identity, {})
+    def get_registrant_options(self, ident_or_type: str | Type[Tr]) -> Mapping[str, Any]:
+        """Get the read-only options for a registrant by ident or type."""
+        if self.registrar:
+            return self.registrar.get_registrant_options(self._kind or self.kind(), ident_or_type)
+        return _EMPTY_OPTIONS
 
     def get_options(self) -> Dict[str, Any]:
         """Get all options for this registry."""
         if self.registrar:
-            return self.registrar.get_registry_options(self.__class__.kind())
+            return self.registrar.get_registry_options(self._kind or self.kind())
         return {}
         
     # -- Main Entrypoint Methods --------------------------------------------
 
     def register(self, klass: Type[RegistrantAbstract]) -> Self:
         """Register a subclass of RegistrantAbstract with this typed registry."""
-
-        # Validate Type[Tr] compatibility
-        if not self.is_compatible(klass):
-            raise TypeError(f"Cannot register {klass.__name__}: incompatible with registry type {self._registrant_type().__name__}")
         
-        # Validate Kind compatibility
-        klass_kind = Resolve(klass).kind
-        if klass_kind != self.kind():
-            raise ValueError(f"Cannot register {klass.__name__}: its kind ('{klass_kind}') does not match the registry's kind ('{self.kind()}')")
-         
         # Register the class if not already registered
-        if (ident := klass.identity()) not in self.registered:
+        if (ident := self._validate_registrant(klass)) not in self.registered:
             self.registered[ident] = klass
             
         return self
+    
+    def bulk_register(self, klasses: Iterable[Type[RegistrantAbstract]]) -> Self:
+        """Register several subclasses of RegistrantAbstract with this typed registry in a single update.
+        
+        All classes are validated before any is registered; as with register(), the first class for an identity wins.
+        """
+        registering: Dict[str, Type] = {}
+        for klass in klasses:
+            if (ident := self._validate_registrant(klass)) not in self.registered:
+                registering.setdefault(ident, klass)
+        
+        self.registered.update(registering)
+        return self
+    
+    def _validate_registrant(self, klass: Type[RegistrantAbstract]) -> str:
+        """Validate that the class can be registered with this registry, returning its identity."""
+
+        # Validate Type[Tr] compatibility (inlined is_compatible() against the class-time registrant type)
+        if not issubclass(klass, registrant_type := self._registrant_cls or self._registrant_type()):
+            raise TypeError(f"Cannot register {klass.__name__}: incompatible with registry type {registrant_type.__name__}")
+        
+        # Validate Kind compatibility
+        klass_kind = resolve_kind(klass)
+        if klass_kind != (kind := self._kind or self.kind()):
+            raise ValueError(f"Cannot register {klass.__name__}: its kind ('{klass_kind}') does not match the registry's kind ('{kind}')")
+         
+        return resolve_identity(klass)
         
 
     
     def get(self, ident_or_type: str | Type[Tr]) -> Tr:
         """Get or initialize a _registered_ RegistrantAbstract instance by its identity or type."""
-        identity = Resolve(ident_or_type).identity
+        identity = resolve_identity(ident_or_type)
+        
+        # Already initialized
+        if (instance := self.initialized.get(identity)) is not None:
+            return instance
             
         # Validate that the identity is registered            
-        if not self.has_registered(identity):
+        klass : Optional[Type[Tr]] = self.registered.get(identity)
+        if klass is None:
             raise ValueError(f"RegistrantAbstract '{identity}' is not registered.")
 
-        # Initialize (if not already) 
-        if not self.has_initialized(identity):
-            klass : Type[Tr] = self.get_registered(identity)
-            self.initialized[identity] = klass(registry=self)
-            
-        return self.initialized[identity]
+        # Initialize
+        instance = self.initialized[identity] = klass(registry=self)
+        return instance
             
     
     @classmethod
     def _registrant_type(cls) -> Type[Tr]:
+        """Return the specific RegistrantAbstract subclass that this registry manages, as inferred at class creation."""
+        if cls._registrant_cls is None:
+            return cls._infer_registrant_type() # raises the descriptive TypeError
+        return cast(Type[Tr], cls._registrant_cls)
+    
+    @classmethod
+    def _infer_registrant_type(cls) -> Type[Tr]:
         """
-        Return the specific RegistrantAbstract subclass that this registry manages.
+        Infer the specific RegistrantAbstract subclass that this registry manages.
 
         This method checks if the class is a subclass of Registry, if it's a parameterized
         Registry, and if the type argument is a subclass of RegistrantAbstract.
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections import UserDict
-from typing import Any, Dict, Self, Type, TypeVar
+from collections.abc import Mapping
+from typing import Any, Self, Type, TypeVar
 
 from .helpers import only_while_initializing as _only_while_initializing
 from .helpers import snake_case
@@ -17,6 +18,8 @@ only_while_initializing = _only_while_initializing
 class ResourceAbstract(RegistrantAbstract, ABC):
     """Base class for all resources within the Bootstrap DI system."""
 
+    __slots__ = ()
+
     @classmethod
     def kind(cls) -> RegistrantKind:
         return "resource" 
@@ -24,6 +27,10 @@ class ResourceAbstract(RegistrantAbstract, ABC):
     @classmethod
     def identity(cls) -> RegistrantIdentity:
         """Derive identity from class name by converting to snake_case and stripping kind suffix."""
+        # Derived once per subclass, when RegistrantAbstract._cached_identity() memoizes it
+        if (cached := cls.__dict__.get("_identity_cache")) is not None:
+            return cached
+        
         kind_suffix = f"_{cls.kind()}"
         class_name_snake = snake_case(cls.__name__)
         if class_name_snake.endswith(kind_suffix):
@@ -37,14 +44,19 @@ class ResourceAbstract(RegistrantAbstract, ABC):
         return self
 
 
-    def options(self) -> Dict[str, Any]:
+    def options(self) -> Mapping[str, Any]:
         """Get the ResourceOptions for this resource instance."""
-        return self.registry.get_registrant_options(self.identity())
+        return self.registry.get_registrant_options(self._cached_identity())
         
 
 
 class ResourceRegistry(Registry[ResourceAbstract], ABC):
-    """A registry specifically for ResourceAbstract subclasses."""
+    """A registry specifically for ResourceAbstract subclasses.
+    
+    Declares empty `__slots__`, so instances don't accept attributes beyond those of Registry; subclass it to add state.
+    """
+
+    __slots__ = ()
     
     @classmethod
     def kind(cls) -> str: 
@@ -1,7 +1,9 @@
 """Unit tests for Bootstrap functionality."""
 
-from typing import Any, Dict
-from unittest.mock import Mock, patch
+import sys
+
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 
 import pytest
 
@@ -9,9 +11,13 @@ from src.podlet import Bootstrap, ResourceAbstract, ResourceRegistry
 from src.podlet.helpers import Resolve
 
 
+_MISSING = object()
+
 class DatabaseResource(ResourceAbstract):
     """A mock database resource for testing."""
     
+    __slots__ = ("connection", "query_count", "_host", "_port")
+    
     @classmethod
     def identity(cls) -> str:
         return "database"
@@ -20,18 +26,23 @@ class DatabaseResource(ResourceAbstract):
         """Initialize mock database connection."""
         self.connection = {"connected": True, "host": "localhost", "port": 5432}
         self.query_count = 0
+        options = self.options()
+        self._host = options.get("host", "localhost")
+        self._port = options.get("port", 5432)
     
     def execute_query(self, query: str) -> Dict[str, Any]:
         """Mock query execution."""
         self.query_count += 1
         return {"status": "success", "query": query, "count": self.query_count}
 
-    def get_host(self) -> str: return self.options().get("host", "localhost")
-    def get_port(self) -> int: return self.options().get("port", 5432)
+    def get_host(self) -> str: return self._host
+    def get_port(self) -> int: return self._port
 
 class CacheResource(ResourceAbstract):
     """A mock cache resource for testing."""
     
+    __slots__ = ("cache", "hits", "misses", "_type", "_ttl")
+    
     @classmethod
     def identity(cls) -> str:
         return "cache"
@@ -41,25 +52,31 @@ class CacheResource(ResourceAbstract):
         self.cache = {}
         self.hits = 0
         self.misses = 0
+        options = self.options()
+        self._type = options.get("type", "default")
+        self._ttl = options.get("ttl", 0)
     
     def get(self, key: str) -> Any:
         """Mock cache get operation."""
-        if key in self.cache:
-            self.hits += 1
-            return self.cache[key]
-        self.misses += 1
-        return None
+        value = self.cache.get(key, _MISSING)
+        if value is _MISSING:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
     
     def set(self, key: str, value: Any) -> None:
         """Mock cache set operation."""
         self.cache[key] = value
 
-    def get_type(self) -> str: return self.options().get("type", "default")
-    def get_ttl(self) -> int: return self.options().get("ttl", 0)
+    def get_type(self) -> str: return self._type
+    def get_ttl(self) -> int: return self._ttl
 
 class LoggerResource(ResourceAbstract):
     """A mock logger resource for testing."""
     
+    __slots__ = ("logs", "_by_level", "_level", "_output")
+    
     @classmethod
     def identity(cls) -> str:
         return "logger"
@@ -67,51 +84,65 @@ class LoggerResource(ResourceAbstract):
     def initialize(self) -> None:
         """Initialize mock logger."""
         self.logs = []
+        self._by_level: Dict[str, list] = {}
+        options = self.options()
+        self._level = options.get("level", "info")
+        self._output = options.get("output", "console")
     
     def log(self, level: str, message: str) -> None:
         """Mock logging operation."""
-        self.logs.append({"level": level, "message": message})
+        entry = {"level": level, "message": message}
+        self.logs.append(entry)
+        self._by_level.setdefault(level, []).append(entry)
     
     def get_logs(self, level: str | None = None) -> list:
         """Get logs, optionally filtered by level."""
         if level is None:
             return self.logs
-        return [log for log in self.logs if log["level"] == level]
-
-    def get_level(self) -> str: return self.options().get("level", "info")
-    def get_output(self) -> str: return self.options().get("output", "console")
-
-
-
-
-@pytest.fixture
-def registrar_options() -> Dict[str, Any]:
-    """Provide a sample options dictionary for testing."""
-    return {
-        "resource": {
-            "database": {
-                "enabled": True,
-                "host": "db.test.local",
-                "port": 3306
-            },
-            "cache": {
-                "enabled": True,
-                "type": "redis",
-                "ttl": 3600
-            },
-            "logger": {
-                "enabled": True,
-                "level": "debug",
-                "output": "file"
-            }
-        }
-    }
-
-
-
-@pytest.fixture
-def bootstrap(registrar_options: Dict[str, Any]) -> Bootstrap:
-    """Fixture to create a Bootstrap instance with test resources."""
+        return list(self._by_level.get(level, ()))
+
+    def get_level(self) -> str: return self._level
+    def get_output(self) -> str: return self._output
+
+
+
+
+# Read-only, so a single options graph can be shared by every test and Bootstrap
+_REGISTRAR_OPTIONS: Mapping[str, Any] = MappingProxyType({
+    "resource": MappingProxyType({
+        "database": MappingProxyType({
+            "enabled": True,
+            "host": "db.test.local",
+            "port": 3306
+        }),
+        "cache": MappingProxyType({
+            "enabled": True,
+            "type": "redis",
+            "ttl": 3600
+        }),
+        "logger": MappingProxyType({
+            "enabled": True,
+            "level": "debug",
+            "output": "file"
+        })
+    })
+})
+
+
+@pytest.fixture(scope="module")
+def registrar_options() -> Mapping[str, Any]:
+    """Provide a sample, read-only options mapping for testing."""
+    return _REGISTRAR_OPTIONS
+
+
+
+@pytest.fixture(scope="module")
+def bootstrap(registrar_options: Mapping[str, Any]) -> Bootstrap:
+    """Fixture to create a Bootstrap instance with test resources, shared across the module.
+    
+    Tests must not mutate its structure; those that do build their own Bootstrap instead.
+    Stateful resource instances are reset per test by `TestBootstrapWithResources.reset_resources`.
+    """
     return Bootstrap(
         resources=[DatabaseResource, CacheResource, LoggerResource],
         options=registrar_options
@@ -123,6 +154,11 @@ def bootstrap(registrar_options: Dict[str, Any]) -> Bootstrap:
 class TestBootstrapWithResources:
     """Test cases for the Bootstrap class."""
 
+    @pytest.fixture(autouse=True)
+    def reset_resources(self, bootstrap: Bootstrap) -> None:
+        """Drop initialized resources so each test gets fresh instances from the shared registrations."""
+        bootstrap.resources().initialized.clear()
+
     def test_resource_registration(self, bootstrap: Bootstrap) -> None:
         """Test that resources are registered correctly."""
         assert bootstrap.has_registry(ResourceAbstract)
@@ -160,7 +196,7 @@ class TestBootstrapWithResources:
         assert len(error_logs) == 1
         assert error_logs[0]["message"] == "This is an error message."
 
-    def test_resource_options(self, bootstrap: Bootstrap, registrar_options: Dict[str, Any]) -> None:
+    def test_resource_options(self, bootstrap: Bootstrap, registrar_options: Mapping[str, Any]) -> None:
         
         # db
         db_resource = bootstrap.get_resource("database")
@@ -227,6 +263,166 @@ class TestBootstrapAdditionalCoverage:
         registry = bootstrap.get_registry(ResourceAbstract)
         assert isinstance(registry, ResourceRegistry)
 
+    def test_identity_from_attribute_set_after_class_body(self) -> None:
+        """Test that identity() may depend on class attributes assigned after the class is created."""
+        class NamedResource(ResourceAbstract):
+            @classmethod
+            def identity(cls) -> str:
+                return cls.NAME  # type: ignore[attr-defined]
+
+            def initialize(self) -> None:
+                pass
+
+        NamedResource.NAME = "named"  # type: ignore[attr-defined]
+        bootstrap = Bootstrap(resources=[NamedResource])
+        assert isinstance(bootstrap.get_resource("named"), NamedResource)
+        assert isinstance(bootstrap.get_resource(NamedResource), NamedResource)
+
+    def test_identity_from_class_decorator_overriding_parent(self) -> None:
+        """Test that a class decorator changing an attribute the parent's identity() reads is honoured."""
+        def named(name: str) -> Any:
+            def decorate(klass: type) -> type:
+                klass.NAME = name  # type: ignore[attr-defined]
+                return klass
+            return decorate
+
+        class BaseResource(ResourceAbstract):
+            NAME = "base"
+
+            @classmethod
+            def identity(cls) -> str:
+                return cls.NAME
+
+            def initialize(self) -> None:
+                pass
+
+        @named("child")
+        class ChildResource(BaseResource):
+            pass
+
+        bootstrap = Bootstrap(resources=[ChildResource])
+        assert ChildResource.identity() == "child"
+        assert isinstance(bootstrap.get_resource("child"), ChildResource)
+        assert not bootstrap.resources().has_registered("base")
+
+    def test_identity_is_not_evaluated_at_class_definition(self) -> None:
+        """Test that identity() reading configuration is only evaluated once the class is resolved."""
+        config: Dict[str, str] = {}
+
+        class ConfiguredResource(ResourceAbstract):
+            @classmethod
+            def identity(cls) -> str:
+                return config["name"]
+
+            def initialize(self) -> None:
+                pass
+
+        config["name"] = "configured"
+        bootstrap = Bootstrap(resources=[ConfiguredResource])
+        assert isinstance(bootstrap.get_resource("configured"), ConfiguredResource)
+
+    def test_non_str_and_abstract_registrant_answers(self) -> None:
+        """Test that registrants returning None or a StrEnum from kind()/identity() can still be defined and used."""
+        from abc import ABC, abstractmethod
+        from enum import StrEnum
+
+        from src.podlet.registrant import RegistrantAbstract
+        from src.podlet.registry import Registry
+
+        class ServiceAbstract(RegistrantAbstract, ABC):
+            @classmethod
+            @abstractmethod
+            def identity(cls) -> str: ...
+
+        class Kind(StrEnum):
+            SERVICE = "service"
+
+        class MailService(ServiceAbstract):
+            @classmethod
+            def kind(cls) -> str:
+                return Kind.SERVICE
+
+            @classmethod
+            def identity(cls) -> str:
+                return "mail"
+
+            def initialize(self) -> None:
+                pass
+
+        class ServiceRegistry(Registry[MailService]):
+            pass
+
+        bootstrap = Bootstrap()
+        bootstrap.register_registry(ServiceRegistry)
+        bootstrap.register(MailService)
+        assert isinstance(bootstrap.get("service", "mail"), MailService)
+        assert isinstance(bootstrap.get(MailService, MailService), MailService)
+
+    def test_initialization_state_defaults_before_init(self) -> None:
+        """Test that the initialization state reads False on an instance whose __init__ hasn't run."""
+        resource = DatabaseResource.__new__(DatabaseResource)
+        assert resource.is_initialized is False
+        assert resource.is_initializing is False
+
+    def test_runtime_registrant_classes_can_be_collected(self) -> None:
+        """Test that resolving a registrant class doesn't keep it alive once its Bootstrap is dropped."""
+        import gc
+        import weakref
+
+        def make_bootstrap() -> "weakref.ref[type]":
+            class EphemeralResource(ResourceAbstract):
+                def initialize(self) -> None:
+                    pass
+
+            bootstrap = Bootstrap(resources=[EphemeralResource])
+            bootstrap.get_resource(EphemeralResource)
+            return weakref.ref(EphemeralResource)
+
+        klass = make_bootstrap()
+        gc.collect()
+        assert klass() is None
+
+    def test_only_while_initializing(self) -> None:
+        """Test the only_while_initializing decorator inside and outside initialize() and on non-registrants."""
+        from src.podlet.resource import only_while_initializing
+
+        class ConfiguredResource(ResourceAbstract):
+            __slots__ = ("value",)
+
+            @only_while_initializing
+            def configure(self, value: int) -> None:
+                """Configure the resource."""
+                self.value = value
+
+            def initialize(self) -> None:
+                self.configure(42)
+
+        resource = Bootstrap(resources=[ConfiguredResource]).get_resource(ConfiguredResource)
+        assert resource.value == 42
+
+        with pytest.raises(RuntimeError, match="can not be called outside of initialization"):
+            resource.configure(7)
+
+        class NotARegistrant:
+            @only_while_initializing
+            def configure(self) -> None:
+                pass
+
+        with pytest.raises(TypeError, match="does not inherit from RegistrantAbstract"):
+            NotARegistrant().configure()
+
+        assert ConfiguredResource.configure.__name__ == "configure"
+        assert ConfiguredResource.configure.__doc__ == "Configure the resource."
+
+    def test_bootstrap_has_registry_resolution(self) -> None:
+        """Test has_registry resolves kinds from strings, registry classes and registrant classes alike."""
+        bootstrap = Bootstrap()
+        assert bootstrap.has_registry("resource")
+        assert bootstrap.has_registry(ResourceRegistry)
+        assert bootstrap.has_registry(ResourceAbstract)
+        assert bootstrap.has_registry(DatabaseResource)
+        assert not bootstrap.has_registry("service")
+
     def test_bootstrap_register_additional_registry(self) -> None:
         """Test registering additional registries beyond default."""
         from dataclasses import dataclass
@@ -260,6 +456,19 @@ class TestBootstrapAdditionalCoverage:
         bootstrap.set_registry_options("resource", registry_opts)
         assert bootstrap.get_registry_options("resource") == registry_opts
 
+    def test_registrant_options_follow_option_changes(self) -> None:
+        """Test that registrant options agree with registry options however the options are changed."""
+        bootstrap = Bootstrap(resources=[DatabaseResource], options={"resource": {"database": {"host": "a"}}})
+        registry = bootstrap.resources()
+        assert registry.get_registrant_options("database")["host"] == "a"
+
+        bootstrap.options = {"resource": {"database": {"host": "b"}}}
+        assert registry.get_registrant_options("database")["host"] == "b"
+
+        bootstrap.options["resource"]["cache"] = {"ttl": 5}
+        assert registry.get_registrant_options("cache")["ttl"] == 5
+        assert registry.get_registrant_options("missing") == {}
+
     def test_resource_registry_through_bootstrap(self) -> None:
         """Test ResourceRegistry integration via Bootstrap methods."""
         bootstrap = Bootstrap(resources=[DatabaseResource])
@@ -270,3 +479,44 @@ class TestBootstrapAdditionalCoverage:
         # Test it can retrieve registered resources
         db = bootstrap.get("resource", "database")
         assert isinstance(db, DatabaseResource)
+
+    def test_get_resource_goes_through_get(self) -> None:
+        """Test that get_resource() and resources() honour overrides of get() and get_registry() in subclasses."""
+        calls = []
+
+        class TracingBootstrap(Bootstrap):
+            def get(self, kind_or_type: Any, ident_or_type: Any) -> Any:
+                calls.append(("get", kind_or_type, ident_or_type))
+                return super().get(kind_or_type, ident_or_type)
+
+            def get_registry(self, kind_or_type: Any) -> Any:
+                calls.append(("get_registry", kind_or_type))
+                return super().get_registry(kind_or_type)
+
+        bootstrap = TracingBootstrap(resources=[DatabaseResource])
+        calls.clear()
+
+        assert isinstance(bootstrap.get_resource(DatabaseResource), DatabaseResource)
+        assert ("get", "resource", "database") in calls
+
+        calls.clear()
+        bootstrap.resources()
+        assert calls == [("get_registry", ResourceAbstract)]
+
+    def test_resources_initialized_lazily(self) -> None:
+        """Test that resources are only initialized on first retrieval and then reused."""
+        bootstrap = Bootstrap(resources=[DatabaseResource, CacheResource])
+        registry = bootstrap.resources()
+        assert registry.initialized == {}
+
+        db = bootstrap.get_resource("database")
+        assert list(registry.initialized) == ["database"]
+        assert bootstrap.get_resource(DatabaseResource) is db
+
+    def test_identities_are_interned(self) -> None:
+        """Test that registered identities and looked-up identities share interned strings."""
+        bootstrap = Bootstrap(resources=[DatabaseResource, CacheResource, LoggerResource])
+        assert all(identity is sys.intern(identity) for identity in bootstrap.resources().registered)
+
+        identity = "".join(["data", "base"]) # built at runtime, so not interned by the compiler
+        assert Resolve(identity).identity is sys.intern(identity)